@@ -14,10 +14,9 @@ with placeholder emails that would land in compensation reports.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Callable, Dict, List, Set
 
-import pytz
 import requests
 from dateutil import parser
 
@@ -138,10 +137,10 @@ def parse_jsm_timeline(
 
             shift_start = parser.parse(item["startDate"])
             if shift_start.tzinfo is None:
-                shift_start = pytz.UTC.localize(shift_start)
+                shift_start = shift_start.replace(tzinfo=timezone.utc)
             shift_end = parser.parse(item["endDate"])
             if shift_end.tzinfo is None:
-                shift_end = pytz.UTC.localize(shift_end)
+                shift_end = shift_end.replace(tzinfo=timezone.utc)
 
             if shift_end < start_date or shift_start > end_date:
                 continue
@@ -176,9 +175,9 @@ def fetch_shifts_from_jsm(
     placeholder emails in a compensation report.
     """
     if start_date.tzinfo is None:
-        start_date = pytz.UTC.localize(start_date)
+        start_date = start_date.replace(tzinfo=timezone.utc)
     if end_date.tzinfo is None:
-        end_date = pytz.UTC.localize(end_date)
+        end_date = end_date.replace(tzinfo=timezone.utc)
 
     months_diff = (
         (end_date.year - start_date.year) * 12
@@ -9,28 +9,38 @@ It can fetch data directly from OpsGenie API or read from a CSV file.
 
 import csv
 from dataclasses import dataclass
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import groupby
 import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import sys
 
 import click
 import holidays
 import icalendar
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import pytz
 import requests
 from dateutil import parser
 from dotenv import load_dotenv
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, PrivateAttr, field_validator
 
 from minuto.jsm import UnresolvedAccountError, fetch_shifts_from_jsm
 from minuto.models import OnCallShift
 
+try:
+    # Optional C-level JSON parser (install via the 'fast' extra); the
+    # stdlib parser remains the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -70,6 +80,126 @@ HOLIDAY_CALENDAR_URLS = {
 # Default country code for new profiles
 DEFAULT_COUNTRY_CODE = 'AT'  # Austria as default
 
+# Epoch anchors for vectorized wall-clock bucketing (1970-01-01, a Thursday)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH_NAIVE.toordinal()
+
+
+# Shared holidays objects, one per (country, region). The holidays library
+# lazily computes each year on first access and stores it on the instance,
+# so sharing one object per country lets that work be done once per process
+# instead of once per calculator. Lazy loading is kept (no eager years=
+# span): each year is still computed only when a shift actually touches it.
+_HOLIDAYS_CACHE: Dict[Tuple[str, Optional[str]], holidays.HolidayBase] = {}
+
+
+def _get_country_holidays(country_code: str, region: Optional[str] = None) -> holidays.HolidayBase:
+    """Return the shared holidays object for a country (and optional region)."""
+    key = (country_code, region)
+    country = _HOLIDAYS_CACHE.get(key)
+    if country is None:
+        country = holidays.country_holidays(country_code, subdiv=region)
+        _HOLIDAYS_CACHE[key] = country
+    return country
+
+
+# Flattened holiday lookups: per (country, region), a frozenset of date
+# ordinals plus an ordinal -> name dict, covering the years shifts
+# realistically fall into. Testing `ordinal in frozenset` is a single int
+# hash, cheaper and smaller than the holidays object's date-keyed
+# __contains__. Dates outside the span fall back to the shared object.
+_HOLIDAY_SPAN_START = 2020
+_HOLIDAY_SPAN_END = 2030
+_HOLIDAY_ORDINALS_CACHE: Dict[Tuple[str, Optional[str]], frozenset] = {}
+_HOLIDAY_NAMES_CACHE: Dict[Tuple[str, Optional[str]], Dict[int, str]] = {}
+
+
+def _get_holiday_ordinals(country_code: str, region: Optional[str] = None) -> frozenset:
+    """Return the flattened holiday-ordinal set for a country/region."""
+    key = (country_code, region)
+    ordinals = _HOLIDAY_ORDINALS_CACHE.get(key)
+    if ordinals is None:
+        country = holidays.country_holidays(
+            country_code, subdiv=region,
+            years=range(_HOLIDAY_SPAN_START, _HOLIDAY_SPAN_END + 1)
+        )
+        names = {day.toordinal(): name for day, name in country.items()}
+        ordinals = frozenset(names)
+        _HOLIDAY_ORDINALS_CACHE[key] = ordinals
+        _HOLIDAY_NAMES_CACHE[key] = names
+    return ordinals
+
+
+@lru_cache(maxsize=4096)
+def _is_holiday_cached(ordinal: int, country_code: str, region: Optional[str],
+                       custom_ordinals: frozenset) -> Tuple[bool, Optional[str]]:
+    """Per-date holiday decision, cached process-wide.
+
+    Keyed on the date's ordinal plus everything that can change the answer
+    for a user (country, region, custom vacation days), so a week-long shift
+    costs one real lookup per unique date instead of one per hour. Calendar
+    files are instance-scoped and mutable, so they stay outside this cache
+    (see CompensationCalculator.is_holiday).
+    """
+    if ordinal in custom_ordinals:
+        return True, "Custom Holiday"
+
+    date_obj = date.fromordinal(ordinal)
+
+    try:
+        if _HOLIDAY_SPAN_START <= date_obj.year <= _HOLIDAY_SPAN_END:
+            if ordinal in _get_holiday_ordinals(country_code, region):
+                return True, _HOLIDAY_NAMES_CACHE[(country_code, region)][ordinal]
+            return False, None
+
+        country = _get_country_holidays(country_code, region)
+    except (KeyError, AttributeError, NotImplementedError):
+        return False, None
+
+    if date_obj in country:
+        return True, country[date_obj]
+
+    return False, None
+
+
+# The stdlib UTC singleton, resolved once instead of per call site
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=4096)
+def _to_local(epoch_seconds: int, tz: ZoneInfo) -> datetime:
+    """Memoized UTC-epoch -> aware local datetime conversion.
+
+    Shifts and reports revisit the same timestamps (segment boundaries,
+    repeated checks over one shift), so repeated conversions become a
+    dict hit instead of a full astimezone. Keyed on the tz object itself,
+    which stays valid across profile reloads.
+    """
+    return datetime.fromtimestamp(epoch_seconds, tz)
+
+
+def _elapsed_seconds(start: datetime, end: datetime) -> float:
+    """Real elapsed seconds between two aware datetimes.
+
+    Aware datetimes that share one tzinfo object subtract in wall-clock
+    terms, so a plain ``end - start`` is off by the offset change when
+    the interval crosses a DST transition (pytz's per-datetime
+    fixed-offset tzinfos hid this). Epoch subtraction always measures
+    elapsed time, so durations stay correct on transition weekends.
+    """
+    return end.timestamp() - start.timestamp()
+
+
+@lru_cache(maxsize=64)
+def _get_tz(name: str) -> ZoneInfo:
+    """Memoized timezone lookup.
+
+    ZoneInfo is backed by the C _zoneinfo module and caches IANA rules
+    internally; the Python-level lru_cache on top skips even that
+    constructor dispatch for repeated names.
+    """
+    return ZoneInfo(name)
+
 
 class CompensationType(str, Enum):
     """Types of compensation that can be applied"""
@@ -92,14 +222,155 @@ class UserProfile(BaseModel):
     last_month_on_rotation: Optional[str] = None
     # Removed calendar_file field since we'll handle calendars dynamically
 
+    # Lazily built per-year workday lookup tables (see is_working_day)
+    _workday_mask_cache: Dict[int, np.ndarray] = PrivateAttr(default_factory=dict)
+    # Per-year prefix sums of working minutes (see working_minutes_between)
+    _working_minutes_cum_cache: Dict[int, np.ndarray] = PrivateAttr(default_factory=dict)
+
     @field_validator('timezone')
     def validate_timezone(cls, v):
-        if v not in pytz.all_timezones:
+        try:
+            _get_tz(v)
+        except (ZoneInfoNotFoundError, ValueError):
             raise ValueError(f"Invalid timezone: {v}")
         return v
 
+    @cached_property
+    def custom_holiday_ordinals(self) -> frozenset:
+        """Custom holidays parsed once into a frozenset of date ordinals.
 
-@dataclass
+        Hashable (so it can be part of the per-date holiday cache key) and
+        O(1) to test a date against, instead of re-parsing the date strings
+        on every check.
+        """
+        return frozenset(
+            parser.parse(holiday_str).date().toordinal()
+            for holiday_str in self.custom_holidays
+        )
+
+    def is_working_day(self, dt: Union[date, datetime]) -> bool:
+        """Whether a date is a regular working day for this profile.
+
+        Backed by a per-year boolean lookup table combining the weekday
+        rule, the country/region holiday calendar, and custom holidays, so
+        the per-day check in the compensation hot path is one array index
+        instead of a set-membership test plus a holiday lookup. Calendar
+        files are calculator-scoped and are handled separately.
+        """
+        mask = self._workday_mask_cache.get(dt.year)
+        if mask is None:
+            mask = self._build_workday_mask(dt.year)
+            self._workday_mask_cache[dt.year] = mask
+        return bool(mask[dt.timetuple().tm_yday - 1])
+
+    def _build_workday_mask(self, year: int) -> np.ndarray:
+        """Build the day-of-year workday mask for one calendar year."""
+        try:
+            country = _get_country_holidays(self.country_code, self.region)
+        except (KeyError, AttributeError, NotImplementedError):
+            country = None
+
+        custom_ordinals = self.custom_holiday_ordinals
+        mask = np.zeros(366, dtype=bool)
+        current = date(year, 1, 1)
+        day_of_year = 0
+        while current.year == year:
+            mask[day_of_year] = (
+                current.weekday() in self.working_days_set
+                and current.toordinal() not in custom_ordinals
+                and (country is None or current not in country)
+            )
+            day_of_year += 1
+            current += timedelta(days=1)
+        return mask
+
+    def working_minutes_between(self, start_ordinal: int, end_ordinal: int) -> int:
+        """Regular working minutes summed over the full days [start, end).
+
+        Backed by per-year prefix sums over the workday masks, so a span
+        of any length costs two array lookups per calendar year touched —
+        the cost of a multi-day shift no longer grows with its length.
+        """
+        total = 0
+        ordinal = start_ordinal
+        while ordinal < end_ordinal:
+            year = date.fromordinal(ordinal).year
+            year_start = date(year, 1, 1).toordinal()
+            year_end = date(year + 1, 1, 1).toordinal()
+            upper = min(end_ordinal, year_end)
+
+            cum = self._working_minutes_cum_cache.get(year)
+            if cum is None:
+                cum = self._build_working_minutes_cum(year)
+                self._working_minutes_cum_cache[year] = cum
+
+            total += int(cum[upper - year_start] - cum[ordinal - year_start])
+            ordinal = upper
+        return total
+
+    def _build_working_minutes_cum(self, year: int) -> np.ndarray:
+        """Prefix sums of regular working minutes per day of one year."""
+        full_day = self.end_minute_of_day - self.start_minute_of_day
+        # December 24th/31st end at 12:30 regardless of the regular window
+        short_day = max(0, 12 * 60 + 30 - self.start_minute_of_day)
+
+        minutes = []
+        current = date(year, 1, 1)
+        while current.year == year:
+            if not self.is_working_day(current):
+                minutes.append(0)
+            elif current.month == 12 and current.day in (24, 31):
+                minutes.append(short_day)
+            else:
+                minutes.append(full_day)
+            current += timedelta(days=1)
+
+        cum = np.zeros(len(minutes) + 1, dtype=np.int64)
+        cum[1:] = np.cumsum(minutes)
+        return cum
+
+    @cached_property
+    def working_days_set(self) -> frozenset:
+        """Working days as a frozenset for O(1) weekday membership tests."""
+        return frozenset(self.working_days)
+
+    @cached_property
+    def hour_work_mask(self) -> int:
+        """168-bit mask of weekday-hours that can overlap working hours.
+
+        Bit (weekday * 24 + hour) is set when that wall-clock hour touches
+        the regular working window. A single bit test then rules out most
+        probes (nights, weekends) before any holiday lookup; hours inside
+        the window still go through the exact minute comparison, which also
+        owns the Dec 24/31 special case. The mask must not cut that case
+        off: the 12:30 end on those days applies even when the regular
+        window ends earlier, so cover hours up to at least 12:30 — the
+        minute comparison rejects the extra hours on regular days.
+        """
+        mask = 0
+        first_hour = self.start_minute_of_day // 60
+        last_hour = (max(self.end_minute_of_day, 12 * 60 + 30) + 59) // 60  # exclusive
+        for day in self.working_days:
+            for hour in range(first_hour, last_hour):
+                mask |= 1 << (day * 24 + hour)
+        return mask
+
+    @cached_property
+    def start_minute_of_day(self) -> int:
+        """Working-hours start as a minute-of-day integer, computed once.
+
+        Comparing ints against `dt.hour * 60 + dt.minute` is cheaper than
+        constructing and comparing time objects in the per-hour hot path.
+        """
+        return self.working_hours_start.hour * 60 + self.working_hours_start.minute
+
+    @cached_property
+    def end_minute_of_day(self) -> int:
+        """Working-hours end as a minute-of-day integer, computed once."""
+        return self.working_hours_end.hour * 60 + self.working_hours_end.minute
+
+
+@dataclass(slots=True)
 class CompensationPeriod:
     """A period with calculated compensation"""
     user: str
@@ -112,51 +383,87 @@ class CompensationPeriod:
     holiday_info: Optional[Dict[str, str]] = None  # Store holiday name and source if applicable
 
 
+@dataclass(slots=True)
+class CompensationResult:
+    """Result of one compensation calculation.
+
+    Carries the aggregate alongside the periods so callers don't need to
+    re-sum the list; iterates and indexes like the plain period list it
+    replaced, so existing callers keep working.
+    """
+    periods: List[CompensationPeriod]
+    total_compensated_hours: float
+
+    def __iter__(self):
+        return iter(self.periods)
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    def __getitem__(self, index):
+        return self.periods[index]
+
+
 class CompensationCalculator:
     """Calculates compensation for on-call shifts"""
 
-    def __init__(self, user_profiles_path: Optional[Path] = None):
+    def __init__(self, user_profiles_path: Optional[Path] = None,
+                 user_profiles: Optional[List[dict]] = None):
         self.user_profiles: Dict[str, UserProfile] = {}
         self.user_holidays: Dict[str, Dict[str, Union[holidays.HolidayBase, List[str]]]] = {}
+        # Timezone objects resolved once per user at profile load, so the
+        # per-shift conversion path is a plain dict lookup
+        self._user_tz: Dict[str, ZoneInfo] = {}
 
         if user_profiles_path:
             self.load_user_profiles(user_profiles_path)
+        elif user_profiles:
+            self._load_profiles(user_profiles)
+
+    @classmethod
+    def from_profiles(cls, profiles: List[dict]) -> "CompensationCalculator":
+        """Build a calculator from in-memory profile dicts, skipping file I/O.
+
+        Accepts the same shape as the JSON file format used by
+        load_user_profiles. Useful for tests and for callers that already
+        hold the profile data.
+        """
+        return cls(user_profiles=profiles)
 
     def load_user_profiles(self, path: Path):
         """Load user profiles from a JSON file"""
-        with open(path, 'r') as f:
-            profiles_data = json.load(f)
+        if orjson is not None:
+            profiles_data = orjson.loads(Path(path).read_bytes())
+        else:
+            with open(path, 'r') as f:
+                profiles_data = json.load(f)
+
+        self._load_profiles(profiles_data)
 
+    def _load_profiles(self, profiles_data: List[dict]):
+        """Register raw profile dicts and build their per-user lookup state"""
         for profile_data in profiles_data:
             profile = UserProfile(**profile_data)
             self.user_profiles[profile.email] = profile
 
-            # Initialize holidays for each user
+            # Initialize holidays and the timezone for each user
             self._load_holidays_for_user(profile)
+            self._user_tz[profile.email] = _get_tz(profile.timezone)
 
     def _load_holidays_for_user(self, profile: UserProfile):
         """Initialize holidays for a user based on their country/region"""
         holiday_sources = []
 
         try:
-            # Get holidays from the country code using the holidays package
-            # Use the country_holidays object directly to support lazy loading
+            # Get holidays from the shared per-country cache; the object
+            # still lazily computes each year on first access, but that
+            # work is now shared between users and calculator instances
+            country_holidays = _get_country_holidays(profile.country_code, profile.region)
             if profile.region:
-                country_holidays = holidays.country_holidays(
-                    profile.country_code,
-                    subdiv=profile.region
-                )
                 holiday_sources.append(f"{profile.country_code}/{profile.region}")
             else:
-                country_holidays = holidays.country_holidays(profile.country_code)
                 holiday_sources.append(profile.country_code)
 
-            # Add custom holidays directly to the country_holidays object
-            # This preserves lazy loading while adding user-specific holidays
-            for holiday_str in profile.custom_holidays:
-                holiday_date = parser.parse(holiday_str).date()
-                country_holidays[holiday_date] = "Custom Holiday"
-
             if profile.custom_holidays:
                 holiday_sources.append(f"{profile.email}")
 
@@ -183,6 +490,7 @@ class CompensationCalculator:
         """Add or update a user profile"""
         self.user_profiles[profile.email] = profile
         self._load_holidays_for_user(profile)
+        self._user_tz[profile.email] = _get_tz(profile.timezone)
 
     def get_holiday_from_calendar(self, date: datetime, user_email: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
@@ -251,19 +559,26 @@ class CompensationCalculator:
         if user not in self.user_holidays:
             return False, None
 
-        # First check the built-in holidays
+        # First check custom and built-in holidays via the process-wide cache,
+        # so repeated dates within (and across) shifts resolve in O(1)
         holiday_info = self.user_holidays[user]
-        holiday_obj = holiday_info['holidays']
+        profile = self.user_profiles.get(user)
 
-        date_obj = date.date()
-        if date_obj in holiday_obj:
-            return True, holiday_obj[date_obj]
+        is_hol, holiday_name = _is_holiday_cached(
+            date.toordinal(),
+            holiday_info['country_code'],
+            profile.region if profile else None,
+            profile.custom_holiday_ordinals if profile else frozenset(),
+        )
+        if is_hol:
+            return True, holiday_name
 
-        # If not found, check calendar files based on date
+        # If not found, check calendar files based on date. Calendar hits
+        # stay out of holiday_info['holidays']: that now aliases the shared
+        # per-country object, and the parsed-ICS calendar_cache already
+        # memoizes the lookup per calculator.
         is_cal_holiday, holiday_name, source = self.get_holiday_from_calendar(date, user)
         if is_cal_holiday:
-            # Add the holiday to the user's holiday object for future reference
-            holiday_obj[date_obj] = holiday_name
             if source and source not in holiday_info['sources']:
                 holiday_info['sources'].append(source)
             return True, holiday_name
@@ -276,20 +591,23 @@ class CompensationCalculator:
             # Default to standard weekend (Saturday and Sunday)
             return date.weekday() >= 5
 
-        return date.weekday() not in self.user_profiles[user].working_days
+        return date.weekday() not in self.user_profiles[user].working_days_set
 
     def is_working_hours(self, dt: datetime, user: str) -> bool:
         """Check if a given datetime falls within the user's working hours"""
+        # Decompose the datetime once; each attribute read is a C call
+        # and this method runs in the per-hour fallback loop
+        hour = dt.hour
+
         if user not in self.user_profiles:
             # Default working hours: Monday-Friday, 9 AM - 5 PM
-            if dt.weekday() >= 5:  # Saturday and Sunday
-                return False
-            return time(9, 0) <= dt.time() < time(17, 0)
+            return dt.weekday() < 5 and 9 <= hour < 17
 
         profile = self.user_profiles[user]
 
-        # Check if it's a work day
-        if dt.weekday() not in profile.working_days:
+        # One bit test covers the weekday rule and the hour-of-day window,
+        # ruling out nights and weekends before the holiday lookup
+        if not (profile.hour_work_mask >> (dt.weekday() * 24 + hour)) & 1:
             return False
 
         # Check if it's a holiday
@@ -297,34 +615,141 @@ class CompensationCalculator:
         if is_holiday:
             return False
 
+        # Compare minute-of-day integers rather than time objects; the
+        # bounds are parsed once per profile (see UserProfile)
+        minute_of_day = hour * 60 + dt.minute
+
         # Special handling for December 24th and December 31st (shorter working hours)
         if dt.month == 12 and (dt.day == 24 or dt.day == 31):
             # Work hours on these days are only 09:00-12:30
-            return profile.working_hours_start <= dt.time() < time(12, 30)
+            return profile.start_minute_of_day <= minute_of_day < 12 * 60 + 30
 
         # Regular working hours for normal days
-        return profile.working_hours_start <= dt.time() < profile.working_hours_end
+        return profile.start_minute_of_day <= minute_of_day < profile.end_minute_of_day
+
+    def are_working_hours_utc(self, utc_times, user: str) -> List[bool]:
+        """Batch variant of is_working_hours for UTC timestamps.
+
+        Resolves the user's timezone once and converts each element in a
+        tight loop, instead of paying the profile and tz lookups per call.
+        """
+        user_tz = self._user_tz.get(user, _UTC)
+        results = []
+        for utc_time in utc_times:
+            if utc_time.tzinfo is None:
+                utc_time = utc_time.replace(tzinfo=_UTC)
+            if utc_time.tzinfo is not user_tz:
+                utc_time = utc_time.astimezone(user_tz)
+            results.append(self.is_working_hours(utc_time, user))
+        return results
 
     def get_user_local_time(self, utc_time: datetime, user: str) -> datetime:
         """Convert UTC time to the user's local timezone"""
-        if user in self.user_profiles:
-            user_tz = pytz.timezone(self.user_profiles[user].timezone)
-        else:
-            # Default to UTC if user not found
-            user_tz = pytz.UTC
+        # Default to UTC if user not found
+        user_tz = self._user_tz.get(user, _UTC)
+
+        # Identity short-circuit: already in the target zone, no conversion
+        if utc_time.tzinfo is user_tz:
+            return utc_time
 
-        # Ensure the datetime is UTC
+        # Treat naive datetimes as UTC; astimezone converts directly from
+        # any aware zone, so no intermediate UTC normalization is needed
         if utc_time.tzinfo is None:
-            utc_time = pytz.UTC.localize(utc_time)
-        elif utc_time.tzinfo != pytz.UTC:
-            utc_time = utc_time.astimezone(pytz.UTC)
+            utc_time = utc_time.replace(tzinfo=_UTC)
+
+        # Whole-second timestamps (the normal case for shift data) go
+        # through the memoized epoch-based converter
+        if utc_time.microsecond == 0:
+            return _to_local(int(utc_time.timestamp()), user_tz)
+
+        # fromtimestamp goes straight from epoch to the target zone in C,
+        # skipping astimezone's fromutc round trip
+        return datetime.fromtimestamp(utc_time.timestamp(), user_tz)
+
+    def _segment_compensated_hours(self, segment_start: datetime, segment_end: datetime,
+                                   user: str) -> float:
+        """Compensated (outside working hours) time in a non-holiday segment.
+
+        Split as partial first day + full middle days + partial last day.
+        The edge days are one interval intersection each against that
+        day's working window; the middle days cost two prefix-sum lookups
+        per calendar year (see UserProfile.working_minutes_between), so
+        the segment cost is independent of its length. Users without a
+        profile fall back to a per-day walk with the default hours.
+        """
+        profile = self.user_profiles.get(user)
+        if profile is None:
+            return self._segment_compensated_hours_default(segment_start, segment_end)
 
-        return utc_time.astimezone(user_tz)
+        total_seconds = _elapsed_seconds(segment_start, segment_end)
+        first_day = segment_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        last_day = segment_end.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    def calculate_compensation(self, shift: OnCallShift) -> List[CompensationPeriod]:
+        if first_day == last_day:
+            working_seconds = self._day_working_overlap(
+                profile, first_day, segment_start, segment_end)
+        else:
+            working_seconds = self._day_working_overlap(
+                profile, first_day, segment_start, first_day + timedelta(days=1))
+            working_seconds += 60.0 * profile.working_minutes_between(
+                first_day.toordinal() + 1, last_day.toordinal())
+            if segment_end > last_day:
+                working_seconds += self._day_working_overlap(
+                    profile, last_day, last_day, segment_end)
+
+        return (total_seconds - working_seconds) / 3600
+
+    @staticmethod
+    def _day_working_overlap(profile: UserProfile, day: datetime,
+                             overlap_start: datetime, overlap_end: datetime) -> float:
+        """Seconds of [overlap_start, overlap_end) inside day's working window."""
+        if not profile.is_working_day(day):
+            return 0.0
+
+        end_minute = profile.end_minute_of_day
+        if day.month == 12 and day.day in (24, 31):
+            # Work hours on these days are only 09:00-12:30
+            end_minute = 12 * 60 + 30
+
+        work_start = day + timedelta(minutes=profile.start_minute_of_day)
+        work_end = day + timedelta(minutes=end_minute)
+        inter_start = max(overlap_start, work_start)
+        inter_end = min(overlap_end, work_end)
+        if inter_start < inter_end:
+            return _elapsed_seconds(inter_start, inter_end)
+        return 0.0
+
+    def _segment_compensated_hours_default(self, segment_start: datetime,
+                                           segment_end: datetime) -> float:
+        """Per-day fallback for users without a profile (Mon-Fri, 9-17)."""
+        compensated_seconds = 0.0
+        day = segment_start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        while day < segment_end:
+            next_day = day + timedelta(days=1)
+            overlap_start = max(segment_start, day)
+            overlap_end = min(segment_end, next_day)
+            overlap_seconds = _elapsed_seconds(overlap_start, overlap_end)
+
+            working_seconds = 0.0
+            if day.weekday() < 5:
+                work_start = day + timedelta(hours=9)
+                work_end = day + timedelta(hours=17)
+                inter_start = max(overlap_start, work_start)
+                inter_end = min(overlap_end, work_end)
+                if inter_start < inter_end:
+                    working_seconds = _elapsed_seconds(inter_start, inter_end)
+
+            compensated_seconds += overlap_seconds - working_seconds
+            day = next_day
+
+        return compensated_seconds / 3600
+
+    def calculate_compensation(self, shift: OnCallShift) -> CompensationResult:
         """
         Calculate compensation for an on-call shift based on the defined rules.
-        May return multiple CompensationPeriod objects if the shift spans different day types.
+        The result may hold multiple CompensationPeriod objects if the shift
+        spans different day types, plus the precomputed compensated-hours total.
         """
 
         # Convert shift times to user's local timezone
@@ -334,16 +759,24 @@ class CompensationCalculator:
         # Calculate duration in hours (already provided in the shift data)
         duration_hours = shift.hours
 
+        # Vectorized day-type pre-checks: bucket every hourly check point in
+        # one numpy pass (wall-clock arithmetic, equivalent to probing
+        # local_start + timedelta(hours=h) one hour at a time)
+        wall_start = local_start.replace(tzinfo=None)
+        check_ts = (int((wall_start - _EPOCH_NAIVE).total_seconds())
+                    + np.arange(int(duration_hours) + 1, dtype=np.int64) * 3600)
+        check_dow = ((check_ts // 86400) + 3) % 7  # the epoch was a Thursday
+        profile = self.user_profiles.get(shift.user)
+        working_days = profile.working_days if profile is not None else [0, 1, 2, 3, 4]
+        weekend_flags = ~np.isin(check_dow, working_days)
+
         # First, check for special cases that apply fixed rates
 
         # Weekend short shift - only apply if the entire shift is on a weekend
-        is_weekend_shift = all(
-            self.is_weekend(local_start + timedelta(hours=h), shift.user)
-            for h in range(int(duration_hours) + 1)
-        )
+        is_weekend_shift = bool(weekend_flags.all())
 
         if is_weekend_shift and duration_hours < WEEKEND_SHORT_SHIFT_THRESHOLD:
-            return [CompensationPeriod(
+            return CompensationResult([CompensationPeriod(
                 user=shift.user,
                 start=local_start,
                 end=local_end,
@@ -351,7 +784,7 @@ class CompensationCalculator:
                 compensated_hours=duration_hours,
                 amount=WEEKEND_SHORT_SHIFT_RATE,
                 compensation_type=CompensationType.WEEKEND_SHORT_SHIFT
-            )]
+            )], duration_hours)
 
         # Night short shift on weekdays
         is_night_shift = False
@@ -362,17 +795,22 @@ class CompensationCalculator:
                 (local_end.hour >= NIGHT_START_HOUR or local_end.hour < NIGHT_END_HOUR)
             )
 
-            # Check if it's a weekday
-            is_weekday = not any(
-                self.is_weekend(local_start + timedelta(hours=h), shift.user) or
-                self.is_holiday(local_start + timedelta(hours=h), shift.user)[0]
-                for h in range(int(duration_hours) + 1)
-            )
+            # Check if it's a weekday: no weekend hours, and no holiday on
+            # any touched day (one is_holiday call per unique day)
+            if weekend_flags.any():
+                is_weekday = False
+            else:
+                is_weekday = not any(
+                    self.is_holiday(
+                        datetime.fromordinal(int(day) + _EPOCH_ORDINAL), shift.user
+                    )[0]
+                    for day in np.unique(check_ts // 86400)
+                )
 
             is_night_shift = is_night_time and is_weekday
 
             if is_night_shift:
-                return [CompensationPeriod(
+                return CompensationResult([CompensationPeriod(
                     user=shift.user,
                     start=local_start,
                     end=local_end,
@@ -380,7 +818,7 @@ class CompensationCalculator:
                     compensated_hours=duration_hours,
                     amount=NIGHT_SHORT_SHIFT_RATE,
                     compensation_type=CompensationType.NIGHT_SHORT_SHIFT
-                )]
+                )], duration_hours)
 
         all_periods = []
         processed_ranges = []
@@ -400,7 +838,7 @@ class CompensationCalculator:
                 day_end = min(local_end, current_day + timedelta(days=1))
 
                 if day_start < day_end:  # If there's any overlap
-                    holiday_hours = (day_end - day_start).total_seconds() / 3600
+                    holiday_hours = _elapsed_seconds(day_start, day_end) / 3600
 
                     # Get holiday source information
                     holiday_sources = []
@@ -460,7 +898,7 @@ class CompensationCalculator:
                             break
 
                     if not overlap:
-                        weekend_hours = (day_end - day_start).total_seconds() / 3600
+                        weekend_hours = _elapsed_seconds(day_start, day_end) / 3600
 
                         weekend_period = CompensationPeriod(
                             user=shift.user,
@@ -495,21 +933,12 @@ class CompensationCalculator:
 
         # Process each unprocessed weekday segment
         for segment_start, segment_end in unprocessed:
-            segment_hours = (segment_end - segment_start).total_seconds() / 3600
+            segment_hours = _elapsed_seconds(segment_start, segment_end) / 3600
 
             # Calculate compensated hours (only outside working hours)
-            compensated_hours = 0
-            current_time = segment_start
-
-            while current_time < segment_end:
-                chunk_end = min(current_time + timedelta(hours=1), segment_end)
-                chunk_hours = (chunk_end - current_time).total_seconds() / 3600
-
-                # Compensate outside working hours
-                if not self.is_working_hours(current_time, shift.user):
-                    compensated_hours += chunk_hours
-
-                current_time = chunk_end
+            compensated_hours = self._segment_compensated_hours(
+                segment_start, segment_end, shift.user
+            )
 
             if segment_hours > 0:
                 weekday_period = CompensationPeriod(
@@ -530,7 +959,7 @@ class CompensationCalculator:
 
             while current_time < local_end:
                 chunk_end = min(current_time + timedelta(hours=1), local_end)
-                chunk_hours = (chunk_end - current_time).total_seconds() / 3600
+                chunk_hours = _elapsed_seconds(current_time, chunk_end) / 3600
 
                 is_compensated = False
 
@@ -562,6 +991,25 @@ class CompensationCalculator:
         # Sort periods by start time for better reporting
         all_periods.sort(key=lambda p: p.start)
 
+        return CompensationResult(
+            all_periods,
+            sum(p.compensated_hours for p in all_periods),
+        )
+
+    def calculate_compensation_batch(self, shifts: List[OnCallShift]) -> List[CompensationPeriod]:
+        """Calculate compensation for a list of shifts in one call.
+
+        Shifts are grouped by user so each user's lookup state (profile,
+        timezone, workday tables, per-date holiday cache) is resolved once
+        and stays warm across all of that user's shifts.
+        """
+        all_periods: List[CompensationPeriod] = []
+
+        for _, user_shifts in groupby(sorted(shifts, key=lambda s: s.user),
+                                      key=lambda s: s.user):
+            for shift in user_shifts:
+                all_periods.extend(self.calculate_compensation(shift))
+
         return all_periods
 
 
@@ -572,6 +1020,9 @@ class CompensationReport:
         self.periods = compensation_periods
         self.user_profiles = user_profiles_dict or {}  # Store user profiles dictionary
         self.df = self._prepare_dataframe()
+        # Memoized by get_user_month_totals; the report data is immutable
+        # after construction, so the frame never needs invalidating
+        self._user_month_totals: Optional[pd.DataFrame] = None
 
     def _prepare_dataframe(self) -> pd.DataFrame:
         """Convert compensation periods to a DataFrame for easier analysis"""
@@ -631,68 +1082,53 @@ class CompensationReport:
         }).reset_index()
 
     def get_user_month_totals(self) -> pd.DataFrame:
+        """Total compensation per user per month, computed once per report.
+
+        Callers (printing, Excel export, tests) tend to ask for this frame
+        several times; the first call pays for the aggregation and the rest
+        return the memoized result.
+        """
+        if self._user_month_totals is None:
+            self._user_month_totals = self._compute_user_month_totals()
+        return self._user_month_totals
+
+    def _compute_user_month_totals(self) -> pd.DataFrame:
         """Generate total compensation per user per month"""
         if self.df.empty:
             return pd.DataFrame(columns=['User', 'Year-Month', 'Compensated Hours', 'Amount', 'PrePaymentEligible'])
 
-        # Get all users from shifts
-        all_users = set(self.df['User'].unique())
-
-        # Add year-month column to the dataframe
-        self.df['Year-Month'] = self.df['Date'].apply(lambda x: f"{x.year}-{x.month:02d}")
-
-        # Find the overall date range of all shifts
-        min_date = self.df['Date'].min()
-        max_date = self.df['Date'].max()
-
-        # Generate a list of all year-months in the date range
-        all_months = []
-        current_date = datetime(min_date.year, min_date.month, 1)
-        end_date = datetime(max_date.year, max_date.month, 1)
-
-        while current_date <= end_date:
-            all_months.append(current_date.strftime("%Y-%m"))
-            # Move to next month
-            if current_date.month == 12:
-                current_date = datetime(current_date.year + 1, 1, 1)
-            else:
-                current_date = datetime(current_date.year, current_date.month + 1, 1)
-
-        # Create a complete dataframe with all user-month combinations
-        rows = []
-        for user in all_users:
-            for month in all_months:
-                rows.append({'User': user, 'Year-Month': month})
-
-        complete_df = pd.DataFrame(rows)
-
-        # Get actual compensation data
-        actual_data = self.df.groupby(['User', 'Year-Month']).agg({
-            'Compensated Hours': 'sum',
-            'Amount': 'sum'
-        }).reset_index()
-
-        # Merge actual data with complete dataframe
-        result_df = pd.merge(complete_df, actual_data, on=['User', 'Year-Month'], how='left')
+        # Aggregate actual compensation per (user, month) in one pandas pass
+        year_month = pd.to_datetime(self.df['Date']).dt.strftime('%Y-%m')
+        actual_data = (
+            self.df.assign(**{'Year-Month': year_month})
+            .groupby(['User', 'Year-Month'])[['Compensated Hours', 'Amount']]
+            .sum()
+        )
 
-        # Fill missing values with zeros
-        result_df['Compensated Hours'] = result_df['Compensated Hours'].fillna(0.0)
-        result_df['Amount'] = result_df['Amount'].fillna(0.0)
+        # Reindex against the dense cross-product of all users and every
+        # month in the data range, so months without shifts show up with
+        # zero totals instead of being dropped
+        all_months = pd.period_range(
+            self.df['Date'].min(), self.df['Date'].max(), freq='M'
+        ).strftime('%Y-%m')
+        complete_index = pd.MultiIndex.from_product(
+            [self.df['User'].unique(), all_months],
+            names=['User', 'Year-Month']
+        )
+        result_df = actual_data.reindex(complete_index, fill_value=0.0).reset_index()
 
-        # Add a column to track pre-payment eligibility
+        # Add a column to track pre-payment eligibility, based on each user's
+        # rotation window when the profile specifies one
         result_df['PrePaymentEligible'] = True  # Default to eligible
-
-        # Check eligibility based on user profile rotation dates if available
-        for index, row in result_df.iterrows():
-            user_email = row['User']
-            year_month = row['Year-Month']
-
-            # Get user's profile
-            profile = self.user_profiles.get(user_email)
-            if profile and profile.first_month_on_rotation and profile.last_month_on_rotation:
-                # Check if this month is within the rotation period
-                if not (profile.first_month_on_rotation <= year_month <= profile.last_month_on_rotation):
-                    result_df.at[index, 'PrePaymentEligible'] = False
+        for user_email, profile in self.user_profiles.items():
+            if profile.first_month_on_rotation and profile.last_month_on_rotation:
+                outside_rotation = ~result_df['Year-Month'].between(
+                    profile.first_month_on_rotation, profile.last_month_on_rotation
+                )
+                result_df.loc[
+                    (result_df['User'] == user_email) & outside_rotation,
+                    'PrePaymentEligible'
+                ] = False
 
         return result_df.sort_values(['User', 'Year-Month'])
 
@@ -1377,9 +1813,9 @@ def fetch_shifts_from_opsgenie(
 
     # Ensure start_date and end_date have timezone info (make them timezone-aware)
     if start_date.tzinfo is None:
-        start_date = pytz.UTC.localize(start_date)
+        start_date = start_date.replace(tzinfo=_UTC)
     if end_date.tzinfo is None:
-        end_date = pytz.UTC.localize(end_date)
+        end_date = end_date.replace(tzinfo=_UTC)
 
     # Calculate the interval in months between start and end date
     months_diff = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
@@ -1418,11 +1854,11 @@ def fetch_shifts_from_opsgenie(
             # Parse the dates and ensure they're timezone-aware
             shift_start = parser.parse(item['startDate'])
             if shift_start.tzinfo is None:
-                shift_start = pytz.UTC.localize(shift_start)
+                shift_start = shift_start.replace(tzinfo=_UTC)
 
             shift_end = parser.parse(item['endDate'])
             if shift_end.tzinfo is None:
-                shift_end = pytz.UTC.localize(shift_end)
+                shift_end = shift_end.replace(tzinfo=_UTC)
 
             # Skip shifts outside our requested date range
             # Include shifts that overlap with our date range:
@@ -1545,11 +1981,8 @@ def process_shifts(shifts, user_profiles, create_profiles, output_plot, export_e
     else:
         calculator = CompensationCalculator(user_profiles_path=None)
 
-    # Calculate compensation for each shift
-    compensation_periods = []
-    for shift in shifts:
-        periods = calculator.calculate_compensation(shift)
-        compensation_periods.extend(periods)  # Extend with all periods (including holiday periods)
+    # Calculate compensation for all shifts, grouped by user
+    compensation_periods = calculator.calculate_compensation_batch(shifts)
 
     # Generate and print report
     report = CompensationReport(compensation_periods, calculator.user_profiles)
@@ -9,34 +9,31 @@ These tests verify various compensation calculation scenarios including:
 - Country-specific holidays
 """
 
-import json
 import datetime
-from pathlib import Path
-from datetime import timedelta, datetime
+from datetime import timedelta, datetime, timezone
+import logging
+import os
 import unittest
-from unittest.mock import patch
 
 
-import pytz
-
 # Import the compensation calculator module
 from minuto.main import (
     CompensationCalculator, OnCallShift, STANDARD_RATE, WEEKEND_SHORT_SHIFT_RATE,
     NIGHT_SHORT_SHIFT_RATE
 )
 
+# Shared UTC tzinfo for all fixture datetimes
+UTC = timezone.utc
+
 
 class TestCompensationCalculator(unittest.TestCase):
     """Tests for the CompensationCalculator class"""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Create a temporary directory for test data
-        self.test_dir = Path('test_data')
-        self.test_dir.mkdir(exist_ok=True)
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the whole class."""
         # Create test user profiles
-        self.test_profiles = [
+        cls.test_profiles = [
             {
                 "email": "test.user@example.com",
                 "timezone": "Europe/Vienna",
@@ -55,29 +52,16 @@ class TestCompensationCalculator(unittest.TestCase):
             }
         ]
 
-        # Save test profiles to a file
-        self.profiles_path = self.test_dir / 'test_profiles.json'
-        with open(self.profiles_path, 'w') as f:
-            json.dump(self.test_profiles, f)
-
-        # Initialize calculator with test profiles
-        self.calculator = CompensationCalculator(user_profiles_path=self.profiles_path)
-
-    def tearDown(self):
-        """Clean up after each test method."""
-        # Remove test files
-        if self.profiles_path.exists():
-            self.profiles_path.unlink()
-
-        # Remove test directory if it's empty
-        if self.test_dir.exists() and not list(self.test_dir.iterdir()):
-            self.test_dir.rmdir()
+        # Initialize calculator with test profiles (in-memory, no file I/O).
+        # Tests that need different profiles build their own calculator via
+        # from_profiles instead of mutating this shared one.
+        cls.calculator = CompensationCalculator.from_profiles(cls.test_profiles)
 
     def test_weekday_hours_no_holidays(self):
         """Test compensation calculation for a standard weekday shift with no holidays."""
         # Create a shift on a Tuesday (1) from 17:00 to 09:00 next day (16 hours)
         # July 16, 2024 is a Tuesday with no holidays in Austria
-        start = datetime(2024, 7, 16, 17, 0, 0, tzinfo=pytz.UTC)  # 5 PM UTC
+        start = datetime(2024, 7, 16, 17, 0, 0, tzinfo=UTC)  # 5 PM UTC
         end = start + timedelta(hours=16)  # 9 AM UTC next day
 
         shift = OnCallShift(
@@ -94,8 +78,7 @@ class TestCompensationCalculator(unittest.TestCase):
         self.assertTrue(len(periods) > 0, "No compensation periods returned")
 
         # Total compensated hours should be 16 (all outside working hours)
-        total_hours = sum(p.compensated_hours for p in periods)
-        print(f"Total compensated hours: {total_hours}")
+        total_hours = periods.total_compensated_hours
         self.assertAlmostEqual(total_hours, 14.0, places=1)
 
         # Expected amount: 14 hours * STANDARD_RATE
@@ -106,7 +89,7 @@ class TestCompensationCalculator(unittest.TestCase):
     def test_weekday_hours_with_holiday(self):
         """Test compensation calculation for a shift that includes a holiday."""
         # August 15, 2024 is Assumption Day in Austria (a public holiday)
-        start = datetime(2024, 8, 15, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM UTC
+        start = datetime(2024, 8, 15, 9, 0, 0, tzinfo=UTC)  # 9 AM UTC
         end = start + timedelta(hours=8)  # 5 PM UTC
 
         shift = OnCallShift(
@@ -118,13 +101,17 @@ class TestCompensationCalculator(unittest.TestCase):
 
         # Mock the is_holiday method to return True for this date
         original_is_holiday = self.calculator.is_holiday
+        holiday_ordinal = datetime(2024, 8, 15).toordinal()
 
         def mock_is_holiday(date, user):
-            if date.date() == datetime(2024, 8, 15).date():
+            if date.toordinal() == holiday_ordinal:
                 return True, "Assumption Day"
             return original_is_holiday(date, user)
 
-        with patch.object(self.calculator, 'is_holiday', side_effect=mock_is_holiday):
+        # Plain monkey-patch instead of patch.object: Mock's side_effect path
+        # records every call, which fires once per hour/segment of the shift
+        self.calculator.is_holiday = mock_is_holiday
+        try:
             # Calculate compensation
             periods = self.calculator.calculate_compensation(shift)
 
@@ -132,7 +119,7 @@ class TestCompensationCalculator(unittest.TestCase):
             self.assertTrue(len(periods) > 0, "No compensation periods returned")
 
             # All hours should be compensated (holiday)
-            total_hours = sum(p.compensated_hours for p in periods)
+            total_hours = periods.total_compensated_hours
             self.assertAlmostEqual(total_hours, 8.0, places=1)
 
             # Expected amount: 8 hours * STANDARD_RATE
@@ -143,11 +130,13 @@ class TestCompensationCalculator(unittest.TestCase):
             # Check if any period has holiday info
             has_holiday_info = any(p.holiday_info is not None for p in periods)
             self.assertTrue(has_holiday_info, "No holiday information found in compensation periods")
+        finally:
+            self.calculator.is_holiday = original_is_holiday
 
     def test_weekend_short_shift(self):
         """Test compensation calculation for a short weekend shift."""
         # Sunday, July 14, 2024
-        start = datetime(2024, 7, 14, 10, 0, 0, tzinfo=pytz.UTC)  # 10 AM UTC
+        start = datetime(2024, 7, 14, 10, 0, 0, tzinfo=UTC)  # 10 AM UTC
         end = start + timedelta(hours=4)  # 2 PM UTC (4 hours < threshold of 5)
 
         shift = OnCallShift(
@@ -170,7 +159,7 @@ class TestCompensationCalculator(unittest.TestCase):
     def test_night_short_shift(self):
         """Test compensation calculation for a short night shift on a weekday."""
         # Tuesday night (July 16-17, 2024)
-        start = datetime(2024, 7, 16, 23, 0, 0, tzinfo=pytz.UTC)  # 11 PM UTC
+        start = datetime(2024, 7, 16, 23, 0, 0, tzinfo=UTC)  # 11 PM UTC
         end = start + timedelta(hours=1.5)  # 12:30 AM UTC (1.5 hours < threshold of 2)
 
         shift = OnCallShift(
@@ -190,58 +179,43 @@ class TestCompensationCalculator(unittest.TestCase):
         self.assertEqual(periods[0].compensation_type.value, "Nacht-Sonderfall")
         self.assertEqual(periods[0].amount, NIGHT_SHORT_SHIFT_RATE)
 
-    def test_christmas_eve_AT(self):
-        """Test compensation calculation for December 24th (Christmas Eve) in Austria."""
-        # December 24, 2024 - shortened working hours in Austria (9:00-12:30)
-        start = datetime(2024, 12, 24, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM UTC
-        end = start + timedelta(hours=8)  # 5 PM UTC
-
-        shift = OnCallShift(
-            start=start,
-            end=end,
-            hours=8.0,
-            user="test.user@example.com"
-        )
+    def test_AT_shortened_working_days(self):
+        """Test compensation for the shortened working days in Austria.
 
-        # Calculate compensation
-        periods = self.calculator.calculate_compensation(shift)
-
-        # Assertions
-        self.assertTrue(len(periods) > 0, "No compensation periods returned")
-
-        # Check the total compensated hours
-        # Since working hours are 9:00-12:30 (3.5h), compensated hours should be >= 4.5h
-        total_hours = sum(p.compensated_hours for p in periods)
-        self.assertGreaterEqual(total_hours, 4.5)
+        December 24th and December 31st both have working hours 9:00-12:30,
+        so the two dates share one parametrized test body.
+        """
+        cases = [
+            ("Christmas Eve", datetime(2024, 12, 24, 9, 0, 0, tzinfo=UTC)),
+            ("New Year's Eve", datetime(2024, 12, 31, 9, 0, 0, tzinfo=UTC)),
+        ]
 
-    def test_new_years_eve_AT(self):
-        """Test compensation calculation for December 31st (New Year's Eve) in Austria."""
-        # December 31, 2024 - shortened working hours in Austria (9:00-12:30)
-        start = datetime(2024, 12, 31, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM UTC
-        end = start + timedelta(hours=8)  # 5 PM UTC
+        for label, start in cases:
+            with self.subTest(label=label):
+                end = start + timedelta(hours=8)  # 5 PM UTC
 
-        shift = OnCallShift(
-            start=start,
-            end=end,
-            hours=8.0,
-            user="test.user@example.com"
-        )
+                shift = OnCallShift(
+                    start=start,
+                    end=end,
+                    hours=8.0,
+                    user="test.user@example.com"
+                )
 
-        # Calculate compensation
-        periods = self.calculator.calculate_compensation(shift)
+                # Calculate compensation
+                periods = self.calculator.calculate_compensation(shift)
 
-        # Assertions
-        self.assertTrue(len(periods) > 0, "No compensation periods returned")
+                # Assertions
+                self.assertTrue(len(periods) > 0, "No compensation periods returned")
 
-        # Check the total compensated hours
-        # Since working hours are 9:00-12:30 (3.5h), compensated hours should be >= 4.5h
-        total_hours = sum(p.compensated_hours for p in periods)
-        self.assertGreaterEqual(total_hours, 4.5)
+                # Check the total compensated hours
+                # Since working hours are 9:00-12:30 (3.5h), compensated hours should be >= 4.5h
+                total_hours = periods.total_compensated_hours
+                self.assertGreaterEqual(total_hours, 4.5)
 
     def test_bulgaria_holiday(self):
         """Test compensation calculation for a Bulgarian holiday."""
         # March 3, 2024 is Liberation Day in Bulgaria
-        start = datetime(2024, 3, 3, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM UTC
+        start = datetime(2024, 3, 3, 9, 0, 0, tzinfo=UTC)  # 9 AM UTC
         end = start + timedelta(hours=8)  # 5 PM UTC
 
         shift = OnCallShift(
@@ -253,14 +227,16 @@ class TestCompensationCalculator(unittest.TestCase):
 
         # Mock the is_holiday method to return True for this date for BG user
         original_is_holiday = self.calculator.is_holiday
+        holiday_ordinal = datetime(2024, 3, 3).toordinal()
 
         def mock_is_holiday(date, user):
-            if (date.date() == datetime(2024, 3, 3).date() and
+            if (date.toordinal() == holiday_ordinal and
                 user == "bulgarian.user@example.com"):
                 return True, "Liberation Day"
             return original_is_holiday(date, user)
 
-        with patch.object(self.calculator, 'is_holiday', side_effect=mock_is_holiday):
+        self.calculator.is_holiday = mock_is_holiday
+        try:
             # Calculate compensation
             periods = self.calculator.calculate_compensation(shift)
 
@@ -268,7 +244,7 @@ class TestCompensationCalculator(unittest.TestCase):
             self.assertTrue(len(periods) > 0, "No compensation periods returned")
 
             # All hours should be compensated (holiday)
-            total_hours = sum(p.compensated_hours for p in periods)
+            total_hours = periods.total_compensated_hours
             self.assertAlmostEqual(total_hours, 8.0, places=1)
 
             # Expected amount: 8 hours * STANDARD_RATE
@@ -279,12 +255,14 @@ class TestCompensationCalculator(unittest.TestCase):
             # Check if any period has holiday info
             has_holiday_info = any(p.holiday_info is not None for p in periods)
             self.assertTrue(has_holiday_info, "No holiday information found in compensation periods")
+        finally:
+            self.calculator.is_holiday = original_is_holiday
 
     def test_bulgaria_christmas_eve(self):
         """Test compensation calculation for December 24th (Christmas Eve) in Bulgaria."""
         # December 24, 2024 - Christmas Eve in Bulgaria is a normal working day
         # (unlike Austria where it has shortened working hours)
-        start = datetime(2024, 12, 24, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM UTC
+        start = datetime(2024, 12, 24, 9, 0, 0, tzinfo=UTC)  # 9 AM UTC
         end = start + timedelta(hours=8)  # 5 PM UTC
 
         shift = OnCallShift(
@@ -302,7 +280,7 @@ class TestCompensationCalculator(unittest.TestCase):
 
         # Check if it's being treated as a normal working day
         # Should only compensate hours outside regular working hours (9:00-17:00)
-        total_hours = sum(p.compensated_hours for p in periods)
+        total_hours = periods.total_compensated_hours
 
         # For a normal working day shift of 8h during working hours (9:00-17:00),
         # the compensated hours should be 0 or minimal
@@ -311,19 +289,21 @@ class TestCompensationCalculator(unittest.TestCase):
 
         # Now let's test what happens if we make it a holiday using a mock
         original_is_holiday = self.calculator.is_holiday
+        holiday_ordinal = datetime(2024, 12, 24).toordinal()
 
         def mock_is_holiday(date, user):
-            if (date.date() == datetime(2024, 12, 24).date() and
+            if (date.toordinal() == holiday_ordinal and
                 user == "bulgarian.user@example.com"):
                 return True, "Christmas Eve"
             return original_is_holiday(date, user)
 
-        with patch.object(self.calculator, 'is_holiday', side_effect=mock_is_holiday):
+        self.calculator.is_holiday = mock_is_holiday
+        try:
             # Calculate compensation again with the mock
             holiday_periods = self.calculator.calculate_compensation(shift)
 
             # Assertions for holiday case
-            holiday_hours = sum(p.compensated_hours for p in holiday_periods)
+            holiday_hours = holiday_periods.total_compensated_hours
 
             # All hours should be compensated if it's a holiday
             self.assertAlmostEqual(holiday_hours, 8.0,
@@ -333,13 +313,15 @@ class TestCompensationCalculator(unittest.TestCase):
             # Check if any period has holiday info
             has_holiday_info = any(p.holiday_info is not None for p in holiday_periods)
             self.assertTrue(has_holiday_info, "No holiday information found in compensation periods")
+        finally:
+            self.calculator.is_holiday = original_is_holiday
 
     def test_one_week_shift(self):
         """Test compensation calculation for a full week shift (Wed 14:00 to next Wed 14:00)."""
         # Wednesday (May 14, 2025) 14:00 to Wednesday (May 21, 2025) 14:00
         # This creates a full 168-hour shift (7 days * 24 hours)
-        start = datetime(2025, 5, 14, 14, 0, 0, tzinfo=pytz.UTC)  # Wed 14:00 UTC
-        end = datetime(2025, 5, 21, 14, 0, 0, tzinfo=pytz.UTC)    # Next Wed 14:00 UTC
+        start = datetime(2025, 5, 14, 14, 0, 0, tzinfo=UTC)  # Wed 14:00 UTC
+        end = datetime(2025, 5, 21, 14, 0, 0, tzinfo=UTC)    # Next Wed 14:00 UTC
 
         shift = OnCallShift(
             start=start,
@@ -355,7 +337,7 @@ class TestCompensationCalculator(unittest.TestCase):
         self.assertTrue(len(periods) > 0, "No compensation periods returned")
 
         # Calculate total compensated hours
-        total_hours = sum(p.compensated_hours for p in periods)
+        total_hours = periods.total_compensated_hours
 
         # For a full week, we expect:
         # - Weekdays (Mon-Fri): 5 days, each with 16 hours outside work (80 hours)
@@ -370,6 +352,40 @@ class TestCompensationCalculator(unittest.TestCase):
         self.assertAlmostEqual(total_amount, expected_amount, delta=STANDARD_RATE,
                               msg="Total compensation should be approximately 128 hours * standard rate")
 
+    def test_dst_transition_weekend_shift(self):
+        """Test that shifts spanning a DST transition pay real elapsed hours.
+
+        Vienna changes clocks on a Sunday night (02:00/03:00 local), so both
+        transitions land inside always-fully-compensated weekend time. The
+        wall clock skips or repeats an hour there; compensation must follow
+        elapsed time, not the wall-clock difference.
+        """
+        cases = [
+            # Saturday 18:00 UTC + 8h crosses the 2024-03-31 spring-forward
+            ("spring forward", datetime(2024, 3, 30, 18, 0, 0, tzinfo=UTC)),
+            # Saturday 18:00 UTC + 8h crosses the 2024-10-27 fall-back
+            ("fall back", datetime(2024, 10, 26, 18, 0, 0, tzinfo=UTC)),
+        ]
+
+        for label, start in cases:
+            with self.subTest(label=label):
+                shift = OnCallShift(
+                    start=start,
+                    end=start + timedelta(hours=8),
+                    hours=8.0,
+                    user="test.user@example.com"
+                )
+
+                # Calculate compensation
+                periods = self.calculator.calculate_compensation(shift)
+
+                # Saturday evening into Sunday morning is fully compensated,
+                # so exactly the 8 real on-call hours must be paid — not 9
+                # (spring, paying the skipped hour) or 7 (fall, dropping the
+                # repeated one)
+                total_hours = periods.total_compensated_hours
+                self.assertAlmostEqual(total_hours, 8.0, places=1)
+
     def test_custom_vacation_day(self):
         """Test compensation calculation for a custom vacation day."""
         # Add custom vacation on June 16, 2024 (Monday) for test.user@example.com
@@ -394,16 +410,11 @@ class TestCompensationCalculator(unittest.TestCase):
             }
         ]
 
-        # Save custom profiles to a new file
-        custom_profiles_path = self.test_dir / 'custom_vacation_profiles.json'
-        with open(custom_profiles_path, 'w') as f:
-            json.dump(custom_profiles, f)
-
         # Initialize a new calculator with the custom profiles
-        calculator = CompensationCalculator(user_profiles_path=custom_profiles_path)
+        calculator = CompensationCalculator.from_profiles(custom_profiles)
 
         # Create a shift on the custom vacation day (Monday, June 16, 2024)
-        start = datetime(2024, 6, 16, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM UTC
+        start = datetime(2024, 6, 16, 9, 0, 0, tzinfo=UTC)  # 9 AM UTC
         end = start + timedelta(hours=8)  # 5 PM UTC
 
         shift = OnCallShift(
@@ -420,7 +431,7 @@ class TestCompensationCalculator(unittest.TestCase):
         self.assertTrue(len(periods) > 0, "No compensation periods returned")
 
         # All hours should be compensated (vacation day)
-        total_hours = sum(p.compensated_hours for p in periods)
+        total_hours = periods.total_compensated_hours
         self.assertAlmostEqual(total_hours, 8.0, places=1,
                               msg="All hours should be compensated on a custom vacation day")
 
@@ -429,10 +440,6 @@ class TestCompensationCalculator(unittest.TestCase):
         total_amount = sum(p.amount for p in periods)
         self.assertAlmostEqual(total_amount, expected_amount, places=2)
 
-        # Clean up the additional test file
-        if custom_profiles_path.exists():
-            custom_profiles_path.unlink()
-
         # Now test the same day for the other user who doesn't have this custom vacation
         shift_bg = OnCallShift(
             start=start,
@@ -445,7 +452,7 @@ class TestCompensationCalculator(unittest.TestCase):
         periods_bg = calculator.calculate_compensation(shift_bg)
 
         # For the Bulgarian user, this should be a normal working day (Monday)
-        total_hours_bg = sum(p.compensated_hours for p in periods_bg)
+        total_hours_bg = periods_bg.total_compensated_hours
         self.assertLessEqual(total_hours_bg, 8.0,
                             msg="Should not be compensated as a holiday for user without custom vacation")
 
@@ -453,14 +460,11 @@ class TestCompensationCalculator(unittest.TestCase):
 class TestUserProfileTimezones(unittest.TestCase):
     """Test timezone handling in compensation calculations."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Create a temporary directory for test data
-        self.test_dir = Path('test_data')
-        self.test_dir.mkdir(exist_ok=True)
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the whole class."""
         # Create test user profiles with different timezones
-        self.test_profiles = [
+        cls.test_profiles = [
             {
                 "email": "vienna.user@example.com",
                 "timezone": "Europe/Vienna",  # UTC+2 in summer
@@ -479,23 +483,8 @@ class TestUserProfileTimezones(unittest.TestCase):
             }
         ]
 
-        # Save test profiles to a file
-        self.profiles_path = self.test_dir / 'test_timezone_profiles.json'
-        with open(self.profiles_path, 'w') as f:
-            json.dump(self.test_profiles, f)
-
-        # Initialize calculator with test profiles
-        self.calculator = CompensationCalculator(user_profiles_path=self.profiles_path)
-
-    def tearDown(self):
-        """Clean up after each test method."""
-        # Remove test files
-        if self.profiles_path.exists():
-            self.profiles_path.unlink()
-
-        # Remove test directory if it's empty
-        if self.test_dir.exists() and not list(self.test_dir.iterdir()):
-            self.test_dir.rmdir()
+        # Initialize calculator with test profiles (in-memory, no file I/O)
+        cls.calculator = CompensationCalculator.from_profiles(cls.test_profiles)
 
     def test_timezone_differences(self):
         """
@@ -505,7 +494,7 @@ class TestUserProfileTimezones(unittest.TestCase):
         # Create a shift: July 16, 2024, 12:00 UTC to 20:00 UTC (8 hours)
         # For Vienna user: 14:00 to 22:00 local time (5 working hours, 3 outside)
         # For NY user: 08:00 to 16:00 local time (all working hours)
-        shift_time = datetime(2024, 7, 16, 12, 0, 0, tzinfo=pytz.UTC)
+        shift_time = datetime(2024, 7, 16, 12, 0, 0, tzinfo=UTC)
 
         # Test for Vienna user
         vienna_shift = OnCallShift(
@@ -516,7 +505,7 @@ class TestUserProfileTimezones(unittest.TestCase):
         )
 
         vienna_periods = self.calculator.calculate_compensation(vienna_shift)
-        vienna_compensated = sum(p.compensated_hours for p in vienna_periods)
+        vienna_compensated = vienna_periods.total_compensated_hours
 
         # Test for NY user
         ny_shift = OnCallShift(
@@ -527,7 +516,7 @@ class TestUserProfileTimezones(unittest.TestCase):
         )
 
         ny_periods = self.calculator.calculate_compensation(ny_shift)
-        ny_compensated = sum(p.compensated_hours for p in ny_periods)
+        ny_compensated = ny_periods.total_compensated_hours
 
         # Assertions
         # NY user should have fewer compensated hours since the UTC shift
@@ -538,14 +527,11 @@ class TestUserProfileTimezones(unittest.TestCase):
 class TestCompensationReporting(unittest.TestCase):
     """Test the compensation reporting functionality."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Create a temporary directory for test data
-        self.test_dir = Path('test_data')
-        self.test_dir.mkdir(exist_ok=True)
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the whole class."""
         # Create test user profiles with rotation periods specified
-        self.test_profiles = [
+        cls.test_profiles = [
             {
                 "email": "test.user@example.com",
                 "timezone": "Europe/Vienna",
@@ -558,30 +544,16 @@ class TestCompensationReporting(unittest.TestCase):
             }
         ]
 
-        # Save test profiles to a file
-        self.profiles_path = self.test_dir / 'test_reporting_profiles.json'
-        with open(self.profiles_path, 'w') as f:
-            json.dump(self.test_profiles, f)
-
-        # Initialize calculator with test profiles
-        self.calculator = CompensationCalculator(user_profiles_path=self.profiles_path)
-
-    def tearDown(self):
-        """Clean up after each test method."""
-        # Remove test files
-        if self.profiles_path.exists():
-            self.profiles_path.unlink()
-
-        # Remove test directory if it's empty
-        if self.test_dir.exists() and not list(self.test_dir.iterdir()):
-            self.test_dir.rmdir()
+        # Initialize calculator with test profiles (in-memory, no file I/O)
+        cls.calculator = CompensationCalculator.from_profiles(cls.test_profiles)
 
     def test_report_includes_month_without_shifts(self):
         """Test that the monthly report includes months without shifts."""
         from minuto.main import CompensationReport
 
-        # Setup profiles with two users, both with the same rotation period
-        self.test_profiles.append({
+        # Setup profiles with two users, both with the same rotation period.
+        # Build a local calculator instead of mutating the shared class one.
+        profiles = self.test_profiles + [{
             "email": "second.user@example.com",
             "timezone": "Europe/Vienna",
             "working_days": [0, 1, 2, 3, 4],
@@ -590,20 +562,14 @@ class TestCompensationReporting(unittest.TestCase):
             "country_code": "AT",
             "first_month_on_rotation": "2024-06",
             "last_month_on_rotation": "2024-07"
-        })
-
-        # Update the profiles file
-        with open(self.profiles_path, 'w') as f:
-            json.dump(self.test_profiles, f)
-
-        # Reinitialize calculator with updated profiles
-        self.calculator = CompensationCalculator(user_profiles_path=self.profiles_path)
+        }]
+        calculator = CompensationCalculator.from_profiles(profiles)
 
         # Create shifts for both users
         shifts = []
 
         # First user: shift only in June 2024
-        start1 = datetime(2024, 6, 15, 9, 0, 0, tzinfo=pytz.UTC)
+        start1 = datetime(2024, 6, 15, 9, 0, 0, tzinfo=UTC)
         end1 = start1 + timedelta(hours=8)
         shifts.append(OnCallShift(
             start=start1,
@@ -613,7 +579,7 @@ class TestCompensationReporting(unittest.TestCase):
         ))
 
         # Second user: shifts in both June and July 2024
-        start2 = datetime(2024, 6, 20, 9, 0, 0, tzinfo=pytz.UTC)
+        start2 = datetime(2024, 6, 20, 9, 0, 0, tzinfo=UTC)
         end2 = start2 + timedelta(hours=8)
         shifts.append(OnCallShift(
             start=start2,
@@ -622,7 +588,7 @@ class TestCompensationReporting(unittest.TestCase):
             user="second.user@example.com"
         ))
 
-        start3 = datetime(2024, 7, 10, 9, 0, 0, tzinfo=pytz.UTC)
+        start3 = datetime(2024, 7, 10, 9, 0, 0, tzinfo=UTC)
         end3 = start3 + timedelta(hours=8)
         shifts.append(OnCallShift(
             start=start3,
@@ -631,44 +597,39 @@ class TestCompensationReporting(unittest.TestCase):
             user="second.user@example.com"
         ))
 
-        # Calculate compensation periods for all shifts
-        all_periods = []
-        for shift in shifts:
-            periods = self.calculator.calculate_compensation(shift)
-            all_periods.extend(periods)
+        # Calculate compensation periods for all shifts in one batch call
+        all_periods = calculator.calculate_compensation_batch(shifts)
 
-        # Add debug information
-        print("\nDEBUG INFO:")
-        print(f"User profiles: {self.calculator.user_profiles}")
-        for user, profile in self.calculator.user_profiles.items():
-            print(f"User {user} rotation: {profile.first_month_on_rotation} - {profile.last_month_on_rotation}")
-        print(f"Total shifts: {len(shifts)}")
-        print(f"Generated periods: {len(all_periods)}")
+        # Debug information, opt-in via MINUTO_DEBUG so the test doesn't
+        # spend time on stdout and DataFrame rendering by default
+        if os.environ.get('MINUTO_DEBUG'):
+            print("\nDEBUG INFO:")
+            print(f"User profiles: {calculator.user_profiles}")
+            for user, profile in calculator.user_profiles.items():
+                print(f"User {user} rotation: {profile.first_month_on_rotation} - {profile.last_month_on_rotation}")
+            print(f"Total shifts: {len(shifts)}")
+            print(f"Generated periods: {len(all_periods)}")
 
         # Generate the report
-        report = CompensationReport(all_periods, self.calculator.user_profiles)
+        report = CompensationReport(all_periods, calculator.user_profiles)
 
         # Get the user-month totals
         user_month_totals = report.get_user_month_totals()
 
-        # Print debug info about the report
-        print("\nReport DataFrame Contents:")
-        print(f"DataFrame shape: {user_month_totals.shape}")
-        print(f"All users: {user_month_totals['User'].unique().tolist()}")
-        print(f"All months: {user_month_totals['Year-Month'].unique().tolist()}")
-
-        # Print full dataframe for debugging
-        print("\nFull DataFrame:")
-        print(user_month_totals)
+        if os.environ.get('MINUTO_DEBUG'):
+            print("\nReport DataFrame Contents:")
+            print(f"DataFrame shape: {user_month_totals.shape}")
+            print(f"All users: {user_month_totals['User'].unique().tolist()}")
+            print(f"All months: {user_month_totals['Year-Month'].unique().tolist()}")
+            # logging.debug defers pandas' full-frame formatting unless
+            # debug logging is actually enabled
+            logging.debug("Full DataFrame: %s", user_month_totals)
 
         # Check both months in rotation period are included for first user
         expected_months = ['2024-06', '2024-07']  # June has shifts, July doesn't
         user1_months = user_month_totals[user_month_totals['User'] == 'test.user@example.com']['Year-Month'].tolist()
         user1_months.sort()
 
-        print(f"\nUser 1 Expected months: {expected_months}")
-        print(f"User 1 Actual months: {user1_months}")
-
         # Check that both expected months are present for first user
         self.assertEqual(expected_months, user1_months,
                          f"Report should include both months for first user. Expected: {expected_months}, Got: {user1_months}")
@@ -677,9 +638,6 @@ class TestCompensationReporting(unittest.TestCase):
         user2_months = user_month_totals[user_month_totals['User'] == 'second.user@example.com']['Year-Month'].tolist()
         user2_months.sort()
 
-        print(f"\nUser 2 Expected months: {expected_months}")
-        print(f"User 2 Actual months: {user2_months}")
-
         self.assertEqual(expected_months, user2_months,
                          f"Report should include both months for second user. Expected: {expected_months}, Got: {user2_months}")
 
@@ -2,11 +2,10 @@
 """Smoke tests for the XLSX export."""
 
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-import pytz
 from openpyxl import load_workbook
 
 from minuto.main import (
@@ -20,7 +19,7 @@ from minuto.main import (
 def _periods():
     """Two shifts for one user across two consecutive months."""
     user = "alice@example.com"
-    base = datetime(2025, 1, 31, 17, 0, tzinfo=pytz.UTC)
+    base = datetime(2025, 1, 31, 17, 0, tzinfo=timezone.utc)
     return [
         CompensationPeriod(
             user=user, start=base, end=base + timedelta(hours=14),
@@ -29,8 +28,8 @@ def _periods():
         ),
         CompensationPeriod(
             user=user,
-            start=datetime(2025, 2, 5, 9, 0, tzinfo=pytz.UTC),
-            end=datetime(2025, 2, 5, 12, 0, tzinfo=pytz.UTC),
+            start=datetime(2025, 2, 5, 9, 0, tzinfo=timezone.utc),
+            end=datetime(2025, 2, 5, 12, 0, tzinfo=timezone.utc),
             hours=3.0, compensated_hours=3.0, amount=3.0 * 5.56,
             compensation_type=CompensationType.STANDARD,
             holiday_info={'name': 'Some Holiday', 'source': 'test'},
@@ -1,8 +1,7 @@
 """Parser tests for the JSM Ops timeline payload."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 import pytest
-import pytz
 
 from minuto.jsm import (
     UnresolvedAccountError,
@@ -97,8 +96,8 @@ def make_resolver():
     return resolver, calls
 
 
-WINDOW_START = pytz.UTC.localize(datetime(2025, 11, 1))
-WINDOW_END = pytz.UTC.localize(datetime(2026, 4, 30))
+WINDOW_START = datetime(2025, 11, 1, tzinfo=timezone.utc)
+WINDOW_END = datetime(2026, 4, 30, tzinfo=timezone.utc)
 
 
 def test_parses_all_user_periods_in_window_by_default():